@@ -15,13 +15,16 @@ if [ ! -f "mcp-servers.sh" ]; then
 fi
 
 echo "Step 1: Making scripts executable..."
-chmod +x mcp-servers.sh test_config.py USAGE_EXAMPLES_V2.sh
+chmod +x mcp-servers.sh USAGE_EXAMPLES_V2.sh
 echo "✅ Done"
 echo ""
 
 echo "Step 2: Testing configuration loader..."
-python3 test_config.py
-if [ $? -ne 0 ]; then
+# The tests need pytest: pip install -e ".[test]"
+if ! python3 -c "import pytest" 2>/dev/null; then
+    echo "⚠️  pytest not installed, skipping tests"
+    echo "   Install it with: pip install -e \".[test]\""
+elif ! python3 -m pytest tests/test_config.py; then
     echo "❌ Configuration tests failed!"
     exit 1
 fi
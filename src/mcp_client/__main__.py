@@ -13,13 +13,13 @@ async def main() -> None:
     # Handle --list-servers
     if args.list_servers:
         try:
-            loader = ServerConfigLoader()
+            loader = ServerConfigLoader(args.config)
             loader.print_servers_table()
         except FileNotFoundError as e:
             print(f"Error: {e}")
             print(
                 "\nNo configuration file found. "
-                "Expected: conf/mcp-servers.json"
+                f"Expected: {args.config or 'conf/mcp-servers.json'}"
             )
             sys.exit(1)
         except Exception as e:
@@ -33,7 +33,7 @@ async def main() -> None:
 
     if args.server:
         try:
-            loader = ServerConfigLoader()
+            loader = ServerConfigLoader(args.config)
             config = loader.get_server(args.server)
             print(f"Using configured server: {args.server}")
             print(f"Description: {config.description}")
@@ -41,7 +41,7 @@ async def main() -> None:
             print(f"Error: {e}")
             print(
                 "\nConfiguration file not found. "
-                "Expected: conf/mcp-servers.json"
+                f"Expected: {args.config or 'conf/mcp-servers.json'}"
             )
             sys.exit(1)
         except KeyError as e:
@@ -76,9 +76,12 @@ async def main() -> None:
     except RuntimeError as e:
         print(e)
         sys.exit(1)
-    except KeyboardInterrupt:
-        print("\n\nInterrupted by user")
-        sys.exit(0)
+    except asyncio.CancelledError:
+        # asyncio.run() turns Ctrl-C into cancellation of this task; an
+        # interrupted chat session has already reported it
+        if not args.chat:
+            print("\n\nInterrupted by user")
+        raise
 
 
 def cli_main():
@@ -86,9 +89,8 @@ def cli_main():
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\n\nInterrupted by user")
         sys.exit(0)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    cli_main()
@@ -0,0 +1,15 @@
+"""JSON parsing shared by the configuration loader and query handlers.
+
+Uses orjson when it is installed (``pip install mcp-client[fast]``),
+falling back to the standard library parser otherwise.
+"""
+
+import json
+from typing import Any, Callable
+
+json_loads: Callable[[str | bytes], Any]
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
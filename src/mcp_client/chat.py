@@ -1,17 +1,60 @@
 """Chat interface for MCP client."""
 
+import asyncio
+import contextlib
+import sys
+import threading
+
 from mcp_client.colors import error_message, user_prompt
 
 
+def _settle(
+    future: asyncio.Future[str], line: str, error: BaseException | None
+) -> None:
+    """Complete future with the line read, unless it was cancelled."""
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(line)
+
+
+async def _read_input(prompt: str) -> str:
+    """Read a line from stdin without blocking the event loop.
+
+    The read runs on a daemon thread rather than the default executor, so
+    an interrupted session exits without waiting for the user to press
+    Enter.
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def read() -> None:
+        line, error = "", None
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            error = e
+        # The loop is gone if the session ended while waiting for input
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(_settle, future, line, error)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
 async def run_chat(handler) -> None:
     """Run an AI-handled chat session with colored prompts."""
     print("\nMCP Client's Chat Started!")
     print("Type your queries or 'quit' to exit.")
 
+    prompt = f"\n{user_prompt()}"
     while True:
         try:
-            # Show colored user prompt
-            query = input(f"\n{user_prompt()}").strip()
+            # Show colored user prompt; read input off the event loop
+            # so other tasks keep running while the user types
+            query = (await _read_input(prompt)).strip()
 
             if not query:
                 continue
@@ -19,13 +62,22 @@ async def run_chat(handler) -> None:
             if query.lower() == "quit":
                 break
 
-            # Process query and print response (handler formats the output)
-            print("\n" + await handler.process_query(query))
+            # Process query and write the response in a single call
+            # (handler formats the output)
+            response = await handler.process_query(query)
+            sys.stdout.write(f"\n{response}\n")
+            sys.stdout.flush()
 
         except KeyboardInterrupt:
             print("\n\nInterrupted by user")
             break
+        except asyncio.CancelledError:
+            # asyncio.run() turns Ctrl-C into cancellation of the main task
+            print("\n\nInterrupted by user")
+            print("\nGoodbye!")
+            raise
         except Exception as e:
-            print(f"\n{error_message(f'Error: {str(e)}')}")
+            sys.stdout.write(f"\n{error_message(f'Error: {str(e)}')}\n")
+            sys.stdout.flush()
 
     print("\nGoodbye!")
@@ -1,11 +1,14 @@
 import argparse
+import functools
 import pathlib
 
 
-def parse_args():
-    """Parse command line arguments and return parsed args."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (constructed once per process)."""
     parser = argparse.ArgumentParser(
-        description="A minimal MCP client with OpenAI and Ollama support"
+        description="A minimal MCP client with OpenAI and Ollama support",
+        allow_abbrev=False,
     )
 
     # Server selection - mutually exclusive
@@ -28,6 +31,16 @@ def parse_args():
         help="list all configured MCP servers and exit",
     )
 
+    parser.add_argument(
+        "--config",
+        "-c",
+        type=pathlib.Path,
+        help=(
+            "path to the server configuration file, JSON or .toml "
+            "(default: conf/mcp-servers.json)"
+        ),
+    )
+
     # Action group
     action_group = parser.add_mutually_exclusive_group()
     action_group.add_argument(
@@ -63,6 +76,12 @@ def parse_args():
         help="show verbose Docker output (for debugging)",
     )
 
+    return parser
+
+
+def parse_args():
+    """Parse command line arguments and return parsed args."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Validation: if not listing servers, need either server_path or --server
@@ -3,10 +3,19 @@
 This module provides color formatting for terminal output using colorama.
 """
 
+import os
+import sys
+
 from colorama import Fore, Style, init
 
-# Initialize colorama for cross-platform support
-init(autoreset=True)
+# Initialize colorama for cross-platform support. Every helper appends
+# Colors.RESET itself, so autoreset is left off. Non-Windows pipes skip the
+# stdout wrapper entirely to avoid scanning every write for ANSI codes;
+# the color codes are emptied instead, so there is nothing to strip.
+_STDOUT_IS_TTY = sys.stdout.isatty()
+_EMIT_CODES = os.name == "nt" or _STDOUT_IS_TTY
+if _EMIT_CODES:
+    init(strip=not _STDOUT_IS_TTY)
 
 
 class Colors:
@@ -40,6 +49,16 @@ class Colors:
     RESET = Style.RESET_ALL
 
 
+if not _EMIT_CODES:
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, "")
+
+
+# Precomputed prompt/prefix strings for the default texts
+USER_PROMPT_DEFAULT = f"{Colors.USER_BOLD}You: {Colors.RESET}"
+ASSISTANT_PREFIX_DEFAULT = f"{Colors.ASSISTANT_BOLD}Assistant: {Colors.RESET}"
+
+
 def colorize(text: str, color: str) -> str:
     """Apply color to text.
 
@@ -62,6 +81,8 @@ def user_prompt(text: str = "You: ") -> str:
     Returns:
         Colored prompt string
     """
+    if text == "You: ":
+        return USER_PROMPT_DEFAULT
     return colorize(text, Colors.USER_BOLD)
 
 
@@ -74,6 +95,8 @@ def assistant_prefix(text: str = "Assistant: ") -> str:
     Returns:
         Colored prefix string
     """
+    if text == "Assistant: ":
+        return ASSISTANT_PREFIX_DEFAULT
     return colorize(text, Colors.ASSISTANT_BOLD)
 
 
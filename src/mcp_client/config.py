@@ -4,13 +4,19 @@ This module handles loading and managing MCP server configurations
 from the conf/mcp-servers.json file.
 """
 
+import functools
 import json
+import os
+import sys
+import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from mcp_client._json import json_loads
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ServerConfig:
     """Configuration for a single MCP server."""
 
@@ -26,14 +32,59 @@ class ServerConfig:
     options: dict[str, Any] | None = None
 
 
+# Separator bars for the servers table
+_BAR80 = "=" * 80
+_RULE80 = "-" * 80
+
+
+@functools.lru_cache(maxsize=8)
+def _load_parsed(path: str, mtime_ns: int) -> dict[str, ServerConfig]:
+    """Parse a JSON (or ``.toml``) configuration file into ServerConfig objects.
+
+    Results are cached per path and modification time, so a file is only
+    reparsed after it changes on disk. Callers must not mutate the result.
+    """
+    raw = Path(path).read_bytes()
+    if path.endswith(".toml"):
+        try:
+            data = tomllib.loads(raw.decode())
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+            raise ValueError(f"Invalid TOML in {path}: {e}") from e
+    else:
+        try:
+            data = json_loads(raw)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"Invalid JSON in {path}: {e}") from e
+
+    servers: dict[str, ServerConfig] = {}
+    servers_data = data.get("mcpServers", {})
+    for name, config in servers_data.items():
+        servers[name] = ServerConfig(
+            name=name,
+            description=config.get("description", ""),
+            command=config.get("command", ""),
+            args=config.get("args", []),
+            transport=config.get("transport", "stdio"),
+            env=config.get("env", {}),
+            docker=config.get("docker", {}),
+            capabilities=config.get("capabilities", {}),
+            mounted_directories=config.get("mounted_directories"),
+            options=config.get("options"),
+        )
+    return servers
+
+
 class ServerConfigLoader:
     """Loads and manages MCP server configurations."""
 
     def __init__(self, config_path: Path | None = None):
         """Initialize the config loader.
 
+        The configuration file is not read until servers are first accessed.
+
         Args:
-            config_path: Path to mcp-servers.json. If None, uses default location.
+            config_path: Path to mcp-servers.json (or a .toml file with the
+                same structure). If None, uses default location.
         """
         if config_path is None:
             # Try to find config in project root
@@ -42,42 +93,33 @@ class ServerConfigLoader:
             config_path = project_root / "conf" / "mcp-servers.json"
 
         self.config_path = config_path
-        self._servers: dict[str, ServerConfig] = {}
-        self._load_config()
+        self._servers: dict[str, ServerConfig] | None = None
 
-    def _load_config(self) -> None:
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached configurations, forcing the next load to reparse."""
+        _load_parsed.cache_clear()
+
+    def _ensure_loaded(self) -> dict[str, ServerConfig]:
+        """Load the configuration on first access and return the servers."""
+        if self._servers is None:
+            self._servers = self._load_config()
+        return self._servers
+
+    def _load_config(self) -> dict[str, ServerConfig]:
         """Load server configurations from JSON file."""
-        if not self.config_path.exists():
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_path}"
-            )
+            ) from None
 
-        try:
-            with open(self.config_path) as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ValueError(
-                f"Invalid JSON in {self.config_path}: {e}"
-            ) from e
-
-        servers_data = data.get("mcpServers", {})
-        for name, config in servers_data.items():
-            self._servers[name] = ServerConfig(
-                name=name,
-                description=config.get("description", ""),
-                command=config.get("command", ""),
-                args=config.get("args", []),
-                transport=config.get("transport", "stdio"),
-                env=config.get("env", {}),
-                docker=config.get("docker", {}),
-                capabilities=config.get("capabilities", {}),
-                mounted_directories=config.get("mounted_directories"),
-                options=config.get("options"),
-            )
+        return _load_parsed(str(self.config_path), mtime_ns)
 
     def list_servers(self) -> list[str]:
         """Return list of available server names."""
-        return sorted(self._servers.keys())
+        return sorted(self._ensure_loaded().keys())
 
     def get_server(self, name: str) -> ServerConfig:
         """Get configuration for a specific server.
@@ -91,45 +133,50 @@ class ServerConfigLoader:
         Raises:
             KeyError: If server name not found
         """
-        if name not in self._servers:
+        servers = self._ensure_loaded()
+        if name not in servers:
             available = ", ".join(self.list_servers())
             raise KeyError(
                 f"Server '{name}' not found. Available: {available}"
             )
-        return self._servers[name]
+        return servers[name]
 
     def get_all_servers(self) -> dict[str, ServerConfig]:
         """Return all server configurations."""
-        return self._servers.copy()
+        return self._ensure_loaded().copy()
 
     def print_servers_table(self) -> None:
         """Print a formatted table of available servers."""
-        if not self._servers:
+        servers = self._ensure_loaded()
+        if not servers:
             print("No servers configured")
             return
 
-        print("\n" + "=" * 80)
-        print("Available MCP Servers")
-        print("=" * 80)
-
-        # Header
-        print(f"{'Name':<15} {'Image':<20} {'Description':<45}")
-        print("-" * 80)
-
-        # Servers
-        for name, config in sorted(self._servers.items()):
+        # Build the whole table and emit it with a single write
+        lines = [
+            "",
+            _BAR80,
+            "Available MCP Servers",
+            _BAR80,
+            f"{'Name':<15} {'Image':<20} {'Description':<45}",
+            _RULE80,
+        ]
+        for name, config in sorted(servers.items()):
             image = config.docker.get("image", "N/A")
-            desc = config.description[:42] + "..." if len(
-                config.description
-            ) > 45 else config.description
-            print(f"{name:<15} {image:<20} {desc:<45}")
-
-        print("=" * 80)
-        print(
-            f"\nTotal servers configured: {len(self._servers)}"
-        )
-        print(
-            "\nUsage: python3 -m mcp_client --server <name> --chat"
-        )
-        print("       python3 -m mcp_client --server <name> --members")
-        print("\n")
+            desc = _truncate(config.description, 45)
+            lines.append(f"{name:<15} {image:<20} {desc:<45}")
+        lines += [
+            _BAR80,
+            f"\nTotal servers configured: {len(servers)}",
+            "\nUsage: python3 -m mcp_client --server <name> --chat",
+            "       python3 -m mcp_client --server <name> --members",
+            "\n\n",
+        ]
+
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
+
+
+def _truncate(text: str, width: int) -> str:
+    """Shorten text to fit width, marking truncation with an ellipsis."""
+    return text if len(text) <= width else text[: width - 3] + "..."
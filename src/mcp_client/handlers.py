@@ -1,13 +1,16 @@
 """Query handlers for different LLM providers."""
 
-import json
+import asyncio
+import io
 import os
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
 from mcp import ClientSession
-from openai import OpenAI
+from openai import AsyncOpenAI, omit
 
+from mcp_client._json import json_loads
 from mcp_client.colors import (
     assistant_prefix,
     colorize,
@@ -17,12 +20,39 @@ from mcp_client.colors import (
 
 MAX_TOKENS = 1000
 
+# (base_url, model) pairs found in Ollama earlier in this process
+_VERIFIED_OLLAMA_MODELS: set[tuple[str, str]] = set()
+
+# Shared fallback for tools without an input schema; never mutated
+_EMPTY_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+# Converted tool lists per MCP session; entries go away with the session
+_SESSION_TOOLS: weakref.WeakKeyDictionary[
+    ClientSession, list[dict[str, Any]]
+] = weakref.WeakKeyDictionary()
+
+
+def _convert_tools(tools: list[Any]) -> list[dict[str, Any]]:
+    """Convert MCP tool definitions to the OpenAI function-tool format."""
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description or "No description",
+                "parameters": getattr(tool, "inputSchema", _EMPTY_SCHEMA),
+            },
+        }
+        for tool in tools
+    ]
+
 
 class BaseQueryHandler(ABC):
     """Abstract base class for query handlers."""
 
     def __init__(self, client_session: ClientSession):
         self.client_session = client_session
+        self._tools_cache: list[dict[str, Any]] | None = None
 
     @abstractmethod
     async def process_query(self, query: str) -> str:
@@ -30,28 +60,35 @@ class BaseQueryHandler(ABC):
         pass
 
     async def _get_tools(self) -> list[dict[str, Any]]:
-        """Get MCP tools formatted for OpenAI-compatible APIs."""
-        response = await self.client_session.list_tools()
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description or "No description",
-                    "parameters": getattr(
-                        tool,
-                        "inputSchema",
-                        {"type": "object", "properties": {}},
-                    ),
-                },
-            }
-            for tool in response.tools
-        ]
-
-    async def _execute_tool(self, tool_call) -> dict[str, Any]:
-        """Execute an MCP tool call and return formatted result."""
+        """Get MCP tools formatted for OpenAI-compatible APIs.
+
+        The converted list is cached per client session, so handlers
+        sharing a session reuse it; call invalidate_tools() if the
+        server's tool catalog changes.
+        """
+        if self._tools_cache is not None:
+            return self._tools_cache
+
+        tools = _SESSION_TOOLS.get(self.client_session)
+        if tools is None:
+            response = await self.client_session.list_tools()
+            tools = _convert_tools(response.tools)
+            _SESSION_TOOLS[self.client_session] = tools
+        self._tools_cache = tools
+        return tools
+
+    def invalidate_tools(self) -> None:
+        """Discard the cached tool list so it is fetched again."""
+        self._tools_cache = None
+        _SESSION_TOOLS.pop(self.client_session, None)
+
+    async def _execute_tool(self, tool_call) -> tuple[str, dict[str, Any]]:
+        """Execute an MCP tool call and return its log line and message."""
         tool_name = tool_call.function.name
-        tool_args = json.loads(tool_call.function.arguments or "{}")
+        raw_args = tool_call.function.arguments
+        tool_args = (
+            json_loads(raw_args) if raw_args and raw_args != "{}" else {}
+        )
 
         try:
             result = await self.client_session.call_tool(
@@ -65,13 +102,10 @@ class BaseQueryHandler(ABC):
             content = f"Error: {e}"
             log = tool_message(f"[{content}]")
 
-        return {
-            "log": log,
-            "message": {
-                "role": "tool",
-                "tool_call_id": tool_call.id,
-                "content": content,
-            },
+        return log, {
+            "role": "tool",
+            "tool_call_id": tool_call.id,
+            "content": content,
         }
 
 
@@ -88,24 +122,26 @@ class OpenAIQueryHandler(BaseQueryHandler):
             raise RuntimeError(
                 "Error: OPENAI_API_KEY environment variable not set",
             )
-        self.openai = OpenAI(api_key=api_key)
+        self.openai = AsyncOpenAI(api_key=api_key)
         self.model = model
 
     async def process_query(self, query: str) -> str:
         """Process a query using OpenAI and available MCP tools."""
         messages = [{"role": "user", "content": query}]
-        initial_response = self.openai.chat.completions.create(
+        initial_response = await self.openai.chat.completions.create(
             model=self.model,
             max_tokens=MAX_TOKENS,
             messages=messages,
-            tools=await self._get_tools(),
+            # OpenAI rejects an empty tool list
+            tools=await self._get_tools() or omit,
         )
 
         current_message = initial_response.choices[0].message
-        result_parts = []
+        buf = io.StringIO()
 
         if current_message.content:
-            result_parts.append(current_message.content)
+            buf.write(current_message.content)
+            buf.write("\n")
 
         if tool_calls := current_message.tool_calls:
             messages.append(
@@ -116,22 +152,28 @@ class OpenAIQueryHandler(BaseQueryHandler):
                 }
             )
 
-            for tool_call in tool_calls:
-                tool_result = await self._execute_tool(tool_call)
-                result_parts.append(tool_result["log"])
-                messages.append(tool_result["message"])
+            # Tool calls are independent; run them concurrently.
+            # gather() preserves input order, keeping messages consistent.
+            tool_results = await asyncio.gather(
+                *(self._execute_tool(tool_call) for tool_call in tool_calls)
+            )
+            for log, message in tool_results:
+                buf.write(log)
+                buf.write("\n")
+                messages.append(message)
 
-            final_response = self.openai.chat.completions.create(
+            final_response = await self.openai.chat.completions.create(
                 model=self.model,
                 max_tokens=MAX_TOKENS,
                 messages=messages,
             )
 
             if content := final_response.choices[0].message.content:
-                result_parts.append(content)
+                buf.write(content)
+                buf.write("\n")
 
         # Format the response with colored prefix
-        response_text = "\n".join(result_parts)
+        response_text = buf.getvalue().removesuffix("\n")
         return f"{assistant_prefix()}{colorize(response_text, Colors.ASSISTANT)}"
 
 
@@ -154,23 +196,37 @@ class OllamaQueryHandler(BaseQueryHandler):
             ) from exc
 
         self.ollama = Client(host=base_url)
+        self.base_url = base_url
         self.model = model
         self._verify_model()
 
     def _verify_model(self) -> None:
-        """Verify that the specified model is available in Ollama."""
+        """Verify that the specified model is available in Ollama.
+
+        Once a (base_url, model) pair is found it is not checked again in
+        this process; missing models are rechecked on each handler.
+        """
+        verify_key = (self.base_url, self.model)
+        if verify_key in _VERIFIED_OLLAMA_MODELS:
+            return
+
         try:
             models = self.ollama.list()
             available_models = [m["name"] for m in models.get("models", [])]
-            if not any(
-                self.model in m or m.startswith(self.model)
-                for m in available_models
+
+            # Allow an untagged name such as "qwen2.5" to match "qwen2.5:7b"
+            tag_prefix = self.model + ":"
+            if self.model in available_models or any(
+                m.startswith(tag_prefix) for m in available_models
             ):
-                print(
-                    f"Warning: Model '{self.model}' not found locally. "
-                    f"Ollama will attempt to pull it on first use."
-                )
-                print(f"Available models: {', '.join(available_models)}")
+                _VERIFIED_OLLAMA_MODELS.add(verify_key)
+                return
+
+            print(
+                f"Warning: Model '{self.model}' not found locally. "
+                f"Ollama will attempt to pull it on first use."
+            )
+            print(f"Available models: {', '.join(available_models)}")
         except Exception as e:
             print(f"Warning: Could not verify Ollama models: {e}")
 
@@ -183,24 +239,31 @@ class OllamaQueryHandler(BaseQueryHandler):
         initial_response = self.ollama.chat(
             model=self.model,
             messages=messages,
-            tools=tools,
+            tools=tools or None,
             options={"num_predict": MAX_TOKENS},
         )
 
         current_message = initial_response["message"]
-        result_parts = []
+        buf = io.StringIO()
 
         if content := current_message.get("content"):
-            result_parts.append(content)
+            buf.write(content)
+            buf.write("\n")
 
         # Handle tool calls if present
         if tool_calls := current_message.get("tool_calls"):
             messages.append(current_message)
 
-            for tool_call in tool_calls:
-                tool_result = await self._execute_tool_ollama(tool_call)
-                result_parts.append(tool_result["log"])
-                messages.append(tool_result["message"])
+            tool_results = await asyncio.gather(
+                *(
+                    self._execute_tool_ollama(tool_call)
+                    for tool_call in tool_calls
+                )
+            )
+            for log, message in tool_results:
+                buf.write(log)
+                buf.write("\n")
+                messages.append(message)
 
             # Get final response after tool execution
             final_response = self.ollama.chat(
@@ -210,15 +273,16 @@ class OllamaQueryHandler(BaseQueryHandler):
             )
 
             if content := final_response["message"].get("content"):
-                result_parts.append(content)
+                buf.write(content)
+                buf.write("\n")
 
         # Format the response with colored prefix
-        response_text = "\n".join(result_parts)
+        response_text = buf.getvalue().removesuffix("\n")
         return f"{assistant_prefix()}{colorize(response_text, Colors.ASSISTANT)}"
 
     async def _execute_tool_ollama(
         self, tool_call: dict[str, Any]
-    ) -> dict[str, Any]:
+    ) -> tuple[str, dict[str, Any]]:
         """Execute an MCP tool call for Ollama format."""
         function = tool_call["function"]
         tool_name = function["name"]
@@ -236,13 +300,35 @@ class OllamaQueryHandler(BaseQueryHandler):
             content = f"Error: {e}"
             log = tool_message(f"[{content}]")
 
-        return {
-            "log": log,
-            "message": {
-                "role": "tool",
-                "content": content,
-            },
-        }
+        return log, {"role": "tool", "content": content}
+
+
+def _make_openai(
+    client_session: ClientSession, model: str | None
+) -> OpenAIQueryHandler:
+    """Create an OpenAI handler, resolving the model from the environment."""
+    model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    return OpenAIQueryHandler(client_session, model=model)
+
+
+def _make_ollama(
+    client_session: ClientSession, model: str | None
+) -> OllamaQueryHandler:
+    """Create an Ollama handler, resolving model and URL from the environment."""
+    # Recommended models for MacBook M3
+    default_model = "qwen2.5:7b"  # Best balance for M3
+    model = model or os.getenv("OLLAMA_MODEL", default_model)
+    base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    return OllamaQueryHandler(client_session, model=model, base_url=base_url)
+
+
+# Handler factories by provider name
+_PROVIDERS: dict[
+    str, Callable[[ClientSession, str | None], BaseQueryHandler]
+] = {
+    "openai": _make_openai,
+    "ollama": _make_ollama,
+}
 
 
 def create_query_handler(
@@ -270,19 +356,11 @@ def create_query_handler(
         else:
             provider = "ollama"
 
-    if provider == "openai":
-        model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        return OpenAIQueryHandler(client_session, model=model)
-    elif provider == "ollama":
-        # Recommended models for MacBook M3
-        default_model = "qwen2.5:7b"  # Best balance for M3
-        model = model or os.getenv("OLLAMA_MODEL", default_model)
-        base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-        return OllamaQueryHandler(
-            client_session, model=model, base_url=base_url
-        )
-    else:
+    try:
+        factory = _PROVIDERS[provider]
+    except KeyError:
         raise RuntimeError(
             f"Error: Unknown provider '{provider}'. "
-            "Valid options: 'openai', 'ollama'"
-        )
+            f"Valid options: {', '.join(map(repr, _PROVIDERS))}"
+        ) from None
+    return factory(client_session, model)
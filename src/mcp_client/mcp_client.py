@@ -1,13 +1,45 @@
+import asyncio
+import contextlib
+import functools
+import io
+import os
 import sys
-from contextlib import AsyncExitStack
-from typing import Any, Awaitable, Callable, ClassVar, Self
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Self, TextIO
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 from mcp_client import chat
 from mcp_client.config import ServerConfig
-from mcp_client.handlers import create_query_handler
+from mcp_client.handlers import BaseQueryHandler, create_query_handler
+
+# Item accessors for the listing results of each member section
+_ACCESSORS = {
+    section: attrgetter(section)
+    for section in ("tools", "prompts", "resources")
+}
+
+# Separator bars for the members report
+_BAR50 = "=" * 50
+_BAR30 = "-" * 30
+
+_DOCKER_HELP = (
+    "\n\nDocker troubleshooting:\n"
+    "1. Ensure Docker is running: docker info\n"
+    "2. Check if image exists: docker images | grep {image}\n"
+    "3. Pull image if needed: docker pull {image}\n"
+)
+
+
+@functools.cache
+def _devnull() -> TextIO:
+    """Return a shared handle to the null device."""
+    return open(os.devnull, "w")
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Discard log output when verbose mode is off."""
 
 
 class MCPClient:
@@ -22,9 +54,29 @@ class MCPClient:
         # Or with server config:
         async with MCPClient(config=server_config) as client:
             # Call client methods here...
+
+    Each ``async with`` block spawns the server process and performs the
+    MCP handshake. Avoid it inside hot loops; connect once and reuse the
+    client, or use get_shared_client().
     """
 
-    client_session: ClassVar[ClientSession]
+    __slots__ = (
+        "server_path",
+        "config",
+        "provider",
+        "model",
+        "verbose",
+        "client_session",
+        "_log",
+        "_stdio_cm",
+        "_session_cm",
+        "_server_params",
+        "_args_display",
+        "_connected",
+        "_handler",
+        "_provider_name",
+        "_connect_lock",
+    )
 
     def __init__(
         self,
@@ -53,41 +105,91 @@ class MCPClient:
         self.provider = provider
         self.model = model
         self.verbose = verbose
-        self.exit_stack = AsyncExitStack()
+        # Verbose messages are passed as print() arguments, so nothing is
+        # formatted when verbose output is off
+        self._log: Callable[..., None] = print if verbose else _noop
+        # The stdio transport and session contexts are managed explicitly;
+        # there are always exactly two of them
+        self._stdio_cm: Any = None
+        self._session_cm: ClientSession | None = None
+        self.client_session: ClientSession | None = None
+        self._server_params: StdioServerParameters | None = None
+        self._args_display = ""
+        self._connected = False
+        self._connect_lock = asyncio.Lock()
+        self._handler: BaseQueryHandler | None = None
+        self._provider_name = ""
 
     async def __aenter__(self) -> Self:
-        cls = type(self)
-        cls.client_session = await self._connect_to_server()
+        await self.connect()
         return self
 
     async def __aexit__(self, *_) -> None:
-        await self.exit_stack.aclose()
+        await self.aclose()
+
+    async def connect(self) -> None:
+        """Connect to the server; does nothing if already connected.
+
+        Concurrent calls are serialized, so only one server is started.
+        """
+        async with self._connect_lock:
+            if self._connected:
+                return
+            self.client_session = await self._connect_to_server()
+            self._connected = True
+
+    async def aclose(self) -> None:
+        """Close the server connection and release its resources."""
+        self._connected = False
+        # The handler is bound to the session being closed
+        self._handler = None
+        self.client_session = None
+        session_cm, self._session_cm = self._session_cm, None
+        stdio_cm, self._stdio_cm = self._stdio_cm, None
+        try:
+            if session_cm is not None:
+                await session_cm.__aexit__(None, None, None)
+        finally:
+            if stdio_cm is not None:
+                await stdio_cm.__aexit__(None, None, None)
+
+    def _require_session(self) -> ClientSession:
+        """Return the connected session, or raise if not connected."""
+        if self.client_session is None:
+            raise RuntimeError("Error: client is not connected")
+        return self.client_session
 
     def _build_server_params(self) -> StdioServerParameters:
-        """Build server parameters based on configuration."""
-        if self.config:
-            # Docker-based server
-            command = self.config.command
-            args = self.config.args.copy()
+        """Build server parameters based on configuration.
 
-            # Add verbose flag if requested
-            if self.verbose and command == "docker":
-                # Docker doesn't have a verbose flag, but we can log
-                print(f"Starting Docker container: {' '.join(args)}")
+        The parameters are built once and reused on later calls.
+        """
+        if self._server_params is None:
+            self._server_params = self._create_server_params()
+            self._args_display = " ".join(self._server_params.args)
+
+            # Docker doesn't have a verbose flag, but we can log
+            if self._server_params.command == "docker":
+                self._log("Starting Docker container:", self._args_display)
 
+        return self._server_params
+
+    def _create_server_params(self) -> StdioServerParameters:
+        """Create server parameters from the config or server path."""
+        if self.config:
+            # Docker-based server
             return StdioServerParameters(
-                command=command,
-                args=args,
+                command=self.config.command,
+                args=list(self.config.args),
                 env=self.config.env if self.config.env else None,
             )
         else:
-            # Legacy Python script server
+            # Legacy Python script server, run directly without a shell
+            # (__init__ guarantees server_path is set without a config)
+            assert self.server_path is not None
             return StdioServerParameters(
-                command="sh",
-                args=[
-                    "-c",
-                    f"{sys.executable} {self.server_path} 2>/dev/null",
-                ],
+                command=sys.executable,
+                args=[self.server_path],
                 env=None,
             )
 
@@ -96,95 +198,233 @@ class MCPClient:
         try:
             server_params = self._build_server_params()
 
-            if self.verbose:
-                server_name = (
-                    self.config.name if self.config else self.server_path
-                )
-                print(f"Connecting to server: {server_name}")
-                print(
-                    f"Command: {server_params.command} "
-                    f"{' '.join(server_params.args)}"
-                )
-
-            read, write = await self.exit_stack.enter_async_context(
-                stdio_client(server=server_params)
-            )
-            client_session = await self.exit_stack.enter_async_context(
-                ClientSession(read, write)
+            self._log(
+                "Connecting to server:",
+                self.config.name if self.config else self.server_path,
             )
+            self._log("Command:", server_params.command, self._args_display)
+
+            # Legacy script servers have their stderr discarded
+            errlog = sys.stderr if self.config else _devnull()
+            stdio_cm = stdio_client(server=server_params, errlog=errlog)
+            read, write = await stdio_cm.__aenter__()
+            self._stdio_cm = stdio_cm
+
+            session_cm = ClientSession(read, write)
+            client_session = await session_cm.__aenter__()
+            self._session_cm = session_cm
             await client_session.initialize()
 
-            if self.verbose:
-                print("✓ Connected successfully")
+            self._log("✓ Connected successfully")
 
             return client_session
         except Exception as e:
+            # Unwind whatever was entered; async with never calls __aexit__
+            # when __aenter__ fails. The connect error is the one to report.
+            with contextlib.suppress(Exception):
+                await self.aclose()
             error_msg = f"Error: Failed to connect to server: {e}"
             if self.config and self.config.command == "docker":
-                error_msg += (
-                    f"\n\nDocker troubleshooting:\n"
-                    f"1. Ensure Docker is running: docker info\n"
-                    f"2. Check if image exists: docker images | grep {self.config.docker.get('image', 'mcp')}\n"
-                    f"3. Pull image if needed: docker pull {self.config.docker.get('image', 'mcp/unknown')}\n"
+                image = self.config.docker.get(
+                    "image", f"mcp/{self.config.name}"
                 )
+                error_msg += _DOCKER_HELP.format(image=image)
             raise RuntimeError(error_msg) from e
 
     async def list_all_members(self) -> None:
         """List all available tools, prompts, and resources."""
+        session = self._require_session()
+        buf = io.StringIO()
         if self.config:
-            print(f"MCP Server: {self.config.name}")
-            print(f"Description: {self.config.description}")
-            print("=" * 50)
+            buf.write(
+                f"MCP Server: {self.config.name}\n"
+                f"Description: {self.config.description}\n"
+                f"{_BAR50}\n"
+            )
         else:
-            print("MCP Server Members")
-            print("=" * 50)
+            buf.write(f"MCP Server Members\n{_BAR50}\n")
 
         sections = {
-            "tools": self.client_session.list_tools,
-            "prompts": self.client_session.list_prompts,
-            "resources": self.client_session.list_resources,
+            "tools": (session.list_tools, _ACCESSORS["tools"]),
+            "prompts": (session.list_prompts, _ACCESSORS["prompts"]),
+            "resources": (session.list_resources, _ACCESSORS["resources"]),
         }
-        for section, listing_method in sections.items():
-            await self._list_section(section, listing_method)
+        # The listings are independent; request them concurrently and
+        # report the results in a fixed order
+        results = await asyncio.gather(
+            *(
+                self._fetch_section(section, listing_method, accessor)
+                for section, (listing_method, accessor) in sections.items()
+            )
+        )
+        for section, items in results:
+            self._format_section(buf, section, items)
 
-        print("\n" + "=" * 50)
+        buf.write(f"\n{_BAR50}\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
-    async def _list_section(
+    async def _fetch_section(
         self,
         section: str,
         list_method: Callable[[], Awaitable[Any]],
-    ) -> None:
+        accessor: Callable[[Any], list[Any]],
+    ) -> tuple[str, list[Any] | Exception]:
+        """Fetch a section's items, returning the error if listing fails."""
         try:
-            items = getattr(await list_method(), section)
-            if items:
-                print(f"\n{section.upper()} ({len(items)}):")
-                print("-" * 30)
-                for item in items:
-                    description = item.description or "No description"
-                    print(f" > {item.name} - {description}")
-            else:
-                print(f"\n{section.upper()}: None available")
+            return section, accessor(await list_method())
         except Exception as e:
-            print(f"\n{section.upper()}: Error - {e}")
+            return section, e
 
-    async def run_chat(self) -> None:
-        """Start interactive chat with MCP server using configured LLM."""
-        try:
-            handler = create_query_handler(
-                self.client_session,
+    def _format_section(
+        self,
+        buf: io.StringIO,
+        section: str,
+        items: list[Any] | Exception,
+    ) -> None:
+        """Write a section's items, or its fetch error, to buf."""
+        if isinstance(items, Exception):
+            buf.write(f"\n{section.upper()}: Error - {items}\n")
+        elif items:
+            buf.write(f"\n{section.upper()} ({len(items)}):\n{_BAR30}\n")
+            for item in items:
+                description = item.description or "No description"
+                buf.write(f" > {item.name} - {description}\n")
+        else:
+            buf.write(f"\n{section.upper()}: None available\n")
+
+    @property
+    def handler(self) -> BaseQueryHandler:
+        """Query handler for the connected session, created on first use."""
+        if self._handler is None:
+            self._handler = create_query_handler(
+                self._require_session(),
                 provider=self.provider,
                 model=self.model,
             )
-            provider_name = type(handler).__name__.replace(
-                "QueryHandler", ""
+            self._provider_name = type(self._handler).__name__.removesuffix(
+                "QueryHandler"
             )
+        return self._handler
+
+    async def run_chat(self) -> None:
+        """Start interactive chat with MCP server using configured LLM."""
+        try:
+            handler = self.handler
             model_name = getattr(handler, "model", "unknown")
 
             if self.config:
                 print(f"\nServer: {self.config.name}")
                 print(f"Description: {self.config.description}")
-            print(f"LLM: {provider_name} with model: {model_name}")
+            print(f"LLM: {self._provider_name} with model: {model_name}")
 
             await chat.run_chat(handler)
         except RuntimeError as e:
             print(e)
+
+
+def _config_key(config: ServerConfig | None) -> tuple[Any, ...] | None:
+    """Identify a server config by the process it launches."""
+    if config is None:
+        return None
+    return (
+        config.name,
+        config.command,
+        tuple(config.args),
+        tuple(sorted(config.env.items())),
+    )
+
+
+class _SharedClient:
+    """A pooled client and the task that owns its connection.
+
+    The stdio transport must be closed by the task that opened it, so each
+    pooled client is connected, kept open and closed by a dedicated owner
+    task rather than by whichever caller happened to create it.
+    """
+
+    __slots__ = ("key", "ready", "closing", "owner")
+
+    def __init__(self, key: tuple[Any, ...], client: MCPClient) -> None:
+        self.key = key
+        self.ready: asyncio.Future[MCPClient] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self.closing = asyncio.Event()
+        self.owner = asyncio.create_task(self._own(client))
+
+    async def _own(self, client: MCPClient) -> None:
+        """Connect the client, then close it once shutdown is requested."""
+        try:
+            try:
+                await client.connect()
+            except asyncio.CancelledError:
+                self.ready.cancel()
+                raise
+            except Exception as e:
+                self.ready.set_exception(e)
+                # Callers re-raise it; avoid "exception never retrieved"
+                self.ready.exception()
+                return
+            self.ready.set_result(client)
+            try:
+                await self.closing.wait()
+            finally:
+                await client.aclose()
+        finally:
+            # Failed or closed connections leave the pool, so a later call
+            # starts a fresh one
+            if _SHARED_CLIENTS.get(self.key) is self:
+                del _SHARED_CLIENTS[self.key]
+
+
+# Clients shared per server, provider and model. Entries are registered
+# before connecting, so concurrent callers wait on the same connection
+# instead of starting their own.
+_SHARED_CLIENTS: dict[tuple[Any, ...], _SharedClient] = {}
+
+
+async def get_shared_client(
+    server_path: str | None = None,
+    provider: str | None = None,
+    model: str | None = None,
+    config: ServerConfig | None = None,
+    verbose: bool = False,
+) -> MCPClient:
+    """Return a connected client shared across calls with the same settings.
+
+    The first call spawns the server and initializes the session; later
+    and concurrent calls, from any task, reuse it. A failed connection is
+    reported to every caller waiting on it and retried by the next call.
+    Call close_shared_clients() on shutdown rather than closing shared
+    clients directly.
+    """
+    key = (server_path, _config_key(config), provider, model)
+    if (entry := _SHARED_CLIENTS.get(key)) is None:
+        client = MCPClient(
+            server_path=server_path,
+            provider=provider,
+            model=model,
+            config=config,
+            verbose=verbose,
+        )
+        entry = _SHARED_CLIENTS[key] = _SharedClient(key, client)
+    # Shield the shared connection from cancellation of any one caller
+    return await asyncio.shield(entry.ready)
+
+
+async def close_shared_clients() -> None:
+    """Close every client created by get_shared_client().
+
+    Every client is closed even if some fail to close; their errors are
+    then raised together as an ExceptionGroup.
+    """
+    entries = list(_SHARED_CLIENTS.values())
+    _SHARED_CLIENTS.clear()
+    for entry in entries:
+        entry.closing.set()
+    results = await asyncio.gather(
+        *(entry.owner for entry in entries), return_exceptions=True
+    )
+    if errors := [r for r in results if isinstance(r, Exception)]:
+        raise ExceptionGroup("Error: failed to close shared clients", errors)
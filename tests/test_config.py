@@ -0,0 +1,138 @@
+"""Tests for the multi-server configuration loader.
+
+Run with ``pytest`` from the project root; add ``-x`` to stop at the
+first failure.
+"""
+
+import json
+import os
+
+import pytest
+
+from mcp_client.config import ServerConfigLoader
+
+# Created at import so server names are available for parametrization
+_LOADER = ServerConfigLoader()
+
+
+@pytest.fixture(scope="module")
+def loader():
+    """Configuration loader shared by every test in this module."""
+    return _LOADER
+
+
+def test_config_loading(loader):
+    """Test configuration file loading."""
+    # The configuration is loaded on first access
+    loader.list_servers()
+    assert loader.config_path.exists()
+
+
+def test_list_servers(loader):
+    """Test listing available servers."""
+    servers = loader.list_servers()
+    assert servers
+    assert servers == sorted(servers)
+
+
+def test_get_server(loader):
+    """Test retrieving server configurations."""
+    test_server = loader.list_servers()[0]
+    config = loader.get_server(test_server)
+
+    assert config.name == test_server
+    assert isinstance(config.description, str)
+    assert isinstance(config.command, str)
+    assert isinstance(config.args, list)
+    assert isinstance(config.transport, str)
+
+
+def test_invalid_server(loader):
+    """Test error handling for invalid server names."""
+    with pytest.raises(KeyError, match="nonexistent-server"):
+        loader.get_server("nonexistent-server")
+
+
+@pytest.mark.parametrize("server_name", _LOADER.list_servers())
+def test_server_details(loader, server_name):
+    """Test detailed server configuration access."""
+    config = loader.get_server(server_name)
+
+    # Verify required fields
+    assert config.name == server_name
+    assert isinstance(config.command, str)
+    assert isinstance(config.args, list)
+    assert isinstance(config.docker, dict)
+
+    # Docker servers must specify an image
+    if config.command == "docker":
+        assert "image" in config.docker
+
+
+def test_table_printing(loader, capsys):
+    """Test formatted table printing."""
+    loader.print_servers_table()
+
+    out = capsys.readouterr().out
+    assert "Available MCP Servers" in out
+    assert f"Total servers configured: {len(loader.list_servers())}" in out
+    for name in loader.list_servers():
+        assert name in out
+
+
+def _write_servers(path, description, mtime_ns):
+    """Write a one-server JSON config and pin its modification time."""
+    path.write_text(
+        json.dumps({"mcpServers": {"demo": {"description": description}}})
+    )
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_reload_after_change(tmp_path):
+    """Test that parsed configs are cached until the file changes."""
+    path = tmp_path / "servers.json"
+    mtime_ns = 1_700_000_000_000_000_000
+    _write_servers(path, "first", mtime_ns)
+    assert ServerConfigLoader(path).get_server("demo").description == "first"
+
+    # A newer mtime invalidates the cached parse
+    _write_servers(path, "second", mtime_ns + 1_000_000_000)
+    assert ServerConfigLoader(path).get_server("demo").description == "second"
+
+    # Same mtime: the cached parse is reused until the cache is cleared
+    _write_servers(path, "third", mtime_ns + 1_000_000_000)
+    assert ServerConfigLoader(path).get_server("demo").description == "second"
+    ServerConfigLoader.clear_cache()
+    assert ServerConfigLoader(path).get_server("demo").description == "third"
+
+
+def test_toml_config(tmp_path):
+    """Test loading a TOML configuration file."""
+    path = tmp_path / "servers.toml"
+    path.write_text(
+        "[mcpServers.time]\n"
+        'description = "Time utilities"\n'
+        'command = "docker"\n'
+        'args = ["run", "-i", "--rm", "mcp/time"]\n'
+        'docker = { image = "mcp/time" }\n'
+    )
+
+    config = ServerConfigLoader(path).get_server("time")
+    assert config.description == "Time utilities"
+    assert config.args == ["run", "-i", "--rm", "mcp/time"]
+    assert config.docker == {"image": "mcp/time"}
+    assert config.transport == "stdio"
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"[mcpServers.time\n", b'description = "\xff"\n'],
+    ids=["syntax", "encoding"],
+)
+def test_invalid_toml_config(tmp_path, content):
+    """Test that malformed TOML files raise ValueError."""
+    path = tmp_path / "servers.toml"
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError, match="Invalid TOML"):
+        ServerConfigLoader(path).list_servers()
@@ -0,0 +1,112 @@
+"""Tests for the tool schemas sent by the query handlers.
+
+Run with ``pytest`` from the project root; add ``-x`` to stop at the
+first failure.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from openai import omit
+
+from mcp_client.handlers import OllamaQueryHandler, OpenAIQueryHandler
+
+_TIME_TOOLS = [
+    SimpleNamespace(
+        name="get_current_time",
+        description="Get the current time in a timezone",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    SimpleNamespace(
+        name="convert_time",
+        description="Convert a time between timezones",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+]
+
+# Queries of every kind; the model decides whether a tool is needed
+_QUERIES = ["What time is it in Tokyo?", "Hello!", "sometimes"]
+
+
+class FakeSession:
+    """MCP session stand-in serving a fixed tool list."""
+
+    def __init__(self, tools):
+        self.tools = tools
+
+    async def list_tools(self):
+        return SimpleNamespace(tools=self.tools)
+
+
+class FakeCompletions:
+    """OpenAI completions stand-in recording each request."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        message = SimpleNamespace(content="ok", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeOllama:
+    """Ollama client stand-in recording each request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def chat(self, **kwargs):
+        self.requests.append(kwargs)
+        return {"message": {"content": "ok"}}
+
+
+def _openai_handler(monkeypatch, tools):
+    """Create an OpenAI handler wired to fakes."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    handler = OpenAIQueryHandler(FakeSession(tools))
+    completions = FakeCompletions()
+    handler.openai = SimpleNamespace(
+        chat=SimpleNamespace(completions=completions)
+    )
+    return handler, completions
+
+
+def _ollama_handler(monkeypatch, tools):
+    """Create an Ollama handler wired to fakes."""
+    monkeypatch.setattr(OllamaQueryHandler, "_verify_model", lambda self: None)
+    handler = OllamaQueryHandler(FakeSession(tools))
+    handler.ollama = FakeOllama()
+    return handler, handler.ollama
+
+
+@pytest.mark.parametrize("query", _QUERIES)
+def test_openai_sends_tools(monkeypatch, query):
+    """Test that every OpenAI query is sent with the server's tools."""
+    handler, completions = _openai_handler(monkeypatch, _TIME_TOOLS)
+    asyncio.run(handler.process_query(query))
+
+    (request,) = completions.requests
+    names = [tool["function"]["name"] for tool in request["tools"]]
+    assert names == ["get_current_time", "convert_time"]
+
+
+def test_openai_omits_empty_tools(monkeypatch):
+    """Test that servers without tools send no tool list to OpenAI."""
+    handler, completions = _openai_handler(monkeypatch, [])
+    asyncio.run(handler.process_query("What time is it in Tokyo?"))
+
+    (request,) = completions.requests
+    assert request["tools"] is omit
+
+
+@pytest.mark.parametrize("query", _QUERIES)
+def test_ollama_sends_tools(monkeypatch, query):
+    """Test that every Ollama query is sent with the server's tools."""
+    handler, ollama = _ollama_handler(monkeypatch, _TIME_TOOLS)
+    asyncio.run(handler.process_query(query))
+
+    (request,) = ollama.requests
+    names = [tool["function"]["name"] for tool in request["tools"]]
+    assert names == ["get_current_time", "convert_time"]
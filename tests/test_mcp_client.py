@@ -0,0 +1,170 @@
+"""Tests for the shared client pool.
+
+The tests start the example MCP server from ``examples/mcp_server``.
+Run with ``pytest`` from the project root; add ``-x`` to stop at the
+first failure.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+from mcp_client import mcp_client
+from mcp_client.config import ServerConfig
+from mcp_client.mcp_client import (
+    MCPClient,
+    close_shared_clients,
+    get_shared_client,
+)
+
+SERVER = str(
+    Path(__file__).parent.parent / "examples" / "mcp_server" / "mcp_server.py"
+)
+
+
+@pytest.fixture
+def connects(monkeypatch):
+    """Count server connections made by MCPClient.connect()."""
+    calls = []
+    original = MCPClient._connect_to_server
+
+    async def counting(self):
+        calls.append(self)
+        return await original(self)
+
+    monkeypatch.setattr(MCPClient, "_connect_to_server", counting)
+    return calls
+
+
+def _config(name, *args):
+    """Build a config that runs the example server through Python."""
+    return ServerConfig(
+        name=name,
+        description="Example server",
+        command=sys.executable,
+        args=[*args, SERVER],
+        transport="stdio",
+        env={},
+        docker={},
+        capabilities={},
+    )
+
+
+def test_shared_client_reused(connects):
+    """Test that calls with the same settings share one connection."""
+
+    async def scenario():
+        first = await get_shared_client(server_path=SERVER)
+        second = await get_shared_client(server_path=SERVER)
+        other = await get_shared_client(server_path=SERVER, model="other")
+        await close_shared_clients()
+        return first, second, other
+
+    first, second, other = asyncio.run(scenario())
+    assert first is second
+    assert other is not first
+    assert len(connects) == 2
+    assert first.client_session is None
+    assert other.client_session is None
+
+
+def test_configs_with_same_name_not_shared(connects):
+    """Test that configs are told apart by more than their name."""
+
+    async def scenario():
+        plain = await get_shared_client(config=_config("example"))
+        unbuffered = await get_shared_client(config=_config("example", "-u"))
+        await close_shared_clients()
+        return plain, unbuffered
+
+    plain, unbuffered = asyncio.run(scenario())
+    assert plain is not unbuffered
+    assert len(connects) == 2
+
+
+def test_concurrent_callers(connects):
+    """Test that concurrent callers in other tasks share and can close."""
+
+    async def scenario():
+        clients = await asyncio.gather(
+            get_shared_client(server_path=SERVER),
+            get_shared_client(server_path=SERVER),
+            asyncio.create_task(get_shared_client(server_path=SERVER)),
+        )
+        tools = await clients[0].client_session.list_tools()
+        await close_shared_clients()
+        return clients, tools
+
+    clients, tools = asyncio.run(scenario())
+    assert len({id(client) for client in clients}) == 1
+    assert len(connects) == 1
+    assert [tool.name for tool in tools.tools] == ["echo"]
+    assert clients[0].client_session is None
+    assert not mcp_client._SHARED_CLIENTS
+
+
+def test_cancelled_caller_does_not_cancel_waiters(connects):
+    """Test that cancelling the first caller leaves the others waiting."""
+
+    async def scenario():
+        first = asyncio.create_task(get_shared_client(server_path=SERVER))
+        second = asyncio.create_task(get_shared_client(server_path=SERVER))
+        await asyncio.sleep(0)
+        first.cancel()
+        client = await second
+        await close_shared_clients()
+        return first, client
+
+    first, client = asyncio.run(scenario())
+    assert first.cancelled()
+    assert isinstance(client, MCPClient)
+    assert len(connects) == 1
+
+
+def test_failed_connect(tmp_path, connects):
+    """Test that a failed connection reaches every caller and is retried."""
+    server = tmp_path / "exits.py"
+    server.write_text("raise SystemExit(1)\n")
+
+    async def scenario():
+        results = await asyncio.gather(
+            get_shared_client(server_path=str(server)),
+            get_shared_client(server_path=str(server)),
+            return_exceptions=True,
+        )
+        pooled = dict(mcp_client._SHARED_CLIENTS)
+        with pytest.raises(RuntimeError, match="Failed to connect"):
+            await get_shared_client(server_path=str(server))
+        return results, pooled
+
+    results, pooled = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not pooled
+    assert len(connects) == 2
+
+
+def test_close_continues_past_errors(monkeypatch):
+    """Test that one failing close does not leave other clients open."""
+    original = MCPClient.aclose
+
+    async def failing(self):
+        await original(self)
+        if self.model == "broken":
+            raise OSError("close failed")
+
+    monkeypatch.setattr(MCPClient, "aclose", failing)
+
+    async def scenario():
+        broken = await get_shared_client(server_path=SERVER, model="broken")
+        healthy = await get_shared_client(server_path=SERVER)
+        with pytest.raises(ExceptionGroup) as excinfo:
+            await close_shared_clients()
+        return broken, healthy, excinfo.value
+
+    broken, healthy, error = asyncio.run(scenario())
+    assert [str(e) for e in error.exceptions] == ["close failed"]
+    assert broken.client_session is None
+    assert healthy.client_session is None
+    assert not mcp_client._SHARED_CLIENTS